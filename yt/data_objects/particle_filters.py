@@ -62,6 +62,7 @@ class ParticleFilter:
         new_fi.name = (self.name, field_name[1])
         if old_fi._function == NullFunc:
             new_fi._function = TranslationFunc(old_fi.name)
+            new_fi._is_lambda = False
         # Marking the field as inherited
         new_fi._inherited_particle_filter = True
         return new_fi
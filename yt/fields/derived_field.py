@@ -8,7 +8,6 @@ from more_itertools import always_iterable
 import yt.units.dimensions as ytdims
 from yt.funcs import iter_fields
 from yt.units.unit_object import Unit
-from yt.utilities.exceptions import YTFieldNotFound
 from yt.utilities.logger import ytLogger as mylog
 
 from .field_detector import FieldDetector
@@ -20,6 +19,7 @@ from .field_exceptions import (
     NeedsParameter,
     NeedsProperty,
 )
+from .field_functions import NullFunc
 
 
 def TranslationFunc(field_name):
@@ -31,10 +31,6 @@ def TranslationFunc(field_name):
     return _TranslationFunc
 
 
-def NullFunc(field, data):
-    raise YTFieldNotFound(field.name)
-
-
 def DeprecatedFieldFunc(ret_field, func, since, removal):
     def _DeprecatedFieldFunc(field, data):
         # Only log a warning if we've already done
@@ -110,7 +106,27 @@ class DerivedField:
        x axis, while nodal_flag = [1, 1, 1] would be defined at the 8 cell corners.
     """
 
-    _inherited_particle_filter = False
+    # There are hundreds of these per dataset, so they do without a __dict__.
+    __slots__ = [
+        "name",
+        "take_log",
+        "display_name",
+        "not_in_all",
+        "display_field",
+        "sampling_type",
+        "vector_field",
+        "ds",
+        "_ionization_label_format",
+        "nodal_flag",
+        "_function",
+        "_is_lambda",
+        "validators",
+        "units",
+        "output_units",
+        "dimensions",
+        "_inherited_particle_filter",
+        "_unit_registry",
+    ]
 
     def __init__(
         self,
@@ -157,6 +173,7 @@ class DerivedField:
             self.nodal_flag = nodal_flag
 
         self._function = function
+        self._is_lambda = getattr(function, "__name__", None) == "<lambda>"
 
         self.validators = list(always_iterable(validators))
 
@@ -190,6 +207,8 @@ class DerivedField:
         if isinstance(dimensions, str):
             dimensions = getattr(ytdims, dimensions)
         self.dimensions = dimensions
+        self._inherited_particle_filter = False
+        self._unit_registry = None
 
     def _copy_def(self):
         dd = {}
@@ -250,8 +269,8 @@ class DerivedField:
         This returns a list of names of fields that this field depends on.
         """
         e = FieldDetector(*args, **kwargs)
-        if self._function.__name__ == "<lambda>":
-            e.requested.append(self.name)
+        if self._is_lambda:
+            e.requested.setdefault(self.name)
         else:
             e[self.name]
         return e
@@ -269,8 +288,6 @@ class DerivedField:
                 values.extend([fd.get_field_parameter(fp) for fp in val.parameters])
         return dict(zip(params, values)), permute_params
 
-    _unit_registry = None
-
     @contextlib.contextmanager
     def unit_registry(self, data):
         old_registry = self._unit_registry
@@ -287,7 +304,6 @@ class DerivedField:
     def __call__(self, data):
         """Return the value of the field in a given *data* object."""
         self.check_available(data)
-        original_fields = data.keys()  # Copy
         if self._function is NullFunc:
             raise RuntimeError(
                 "Something has gone terribly wrong, _function is NullFunc "
@@ -295,9 +311,6 @@ class DerivedField:
             )
         with self.unit_registry(data):
             dd = self._function(self, data)
-        for field_name in data.keys():
-            if field_name not in original_fields:
-                del data[field_name]
         return dd
 
     def get_source(self):
@@ -479,10 +492,12 @@ class DerivedField:
 
 
 class FieldValidator:
-    pass
+    __slots__ = ()
 
 
 class ValidateParameter(FieldValidator):
+    __slots__ = ["parameters", "parameter_values"]
+
     def __init__(self, parameters, parameter_values=None):
         """
         This validator ensures that the dataset has a given parameter.
@@ -495,16 +510,15 @@ class ValidateParameter(FieldValidator):
         self.parameter_values = parameter_values
 
     def __call__(self, data):
-        doesnt_have = []
-        for p in self.parameters:
-            if not data.has_field_parameter(p):
-                doesnt_have.append(p)
-        if len(doesnt_have) > 0:
+        doesnt_have = [p for p in self.parameters if not data.has_field_parameter(p)]
+        if doesnt_have:
             raise NeedsParameter(doesnt_have)
         return True
 
 
 class ValidateDataField(FieldValidator):
+    __slots__ = ["fields"]
+
     def __init__(self, field):
         """
         This validator ensures that the output file has a given data field stored
@@ -514,18 +528,18 @@ class ValidateDataField(FieldValidator):
         self.fields = list(iter_fields(field))
 
     def __call__(self, data):
-        doesnt_have = []
         if isinstance(data, FieldDetector):
             return True
-        for f in self.fields:
-            if f not in data.index.field_list:
-                doesnt_have.append(f)
-        if len(doesnt_have) > 0:
+        field_list = data.index.field_list
+        doesnt_have = [f for f in self.fields if f not in field_list]
+        if doesnt_have:
             raise NeedsDataField(doesnt_have)
         return True
 
 
 class ValidateProperty(FieldValidator):
+    __slots__ = ["prop"]
+
     def __init__(self, prop):
         """
         This validator ensures that the data object has a given python attribute.
@@ -534,16 +548,15 @@ class ValidateProperty(FieldValidator):
         self.prop = list(always_iterable(prop))
 
     def __call__(self, data):
-        doesnt_have = []
-        for p in self.prop:
-            if not hasattr(data, p):
-                doesnt_have.append(p)
-        if len(doesnt_have) > 0:
+        doesnt_have = [p for p in self.prop if not hasattr(data, p)]
+        if doesnt_have:
             raise NeedsProperty(doesnt_have)
         return True
 
 
 class ValidateSpatial(FieldValidator):
+    __slots__ = ["ghost_zones", "fields"]
+
     def __init__(self, ghost_zones=0, fields=None):
         """
         This validator ensures that the data handed to the field is of spatial
@@ -565,6 +578,8 @@ class ValidateSpatial(FieldValidator):
 
 
 class ValidateGridType(FieldValidator):
+    __slots__ = ()
+
     def __init__(self):
         """
         This validator ensures that the data handed to the field is an actual
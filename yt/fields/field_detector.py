@@ -6,6 +6,7 @@ from yt.units.yt_array import YTArray
 from yt.utilities.io_handler import io_registry
 
 from .field_exceptions import NeedsGridType
+from .field_functions import NullFunc
 
 fp_units = {
     "bulk_velocity": "cm/s",
@@ -78,20 +79,30 @@ class FieldDetector(defaultdict):
                 return 1.0
 
         self.index = fake_index()
-        self.requested = []
-        self.requested_parameters = []
+        # dicts are used as insertion-ordered sets
+        self.requested = {}
+        self.requested_parameters = {}
+        defaultdict.__init__(self, self._default_values)
+
+    # Fields that are not found, as well as the results of particle deposits
+    # and smoothing, are filled with ones plus a small perturbation.  The
+    # perturbation is drawn once per detector and each missing field uses a
+    # different window into it, so that every miss only costs a single
+    # allocation while still getting distinct values.
+    _noise = None
+    _noise_offset = 0
+
+    def _default_values(self):
+        size = self.nd * self.nd * self.nd
+        if self._noise is None:
+            prng = np.random.RandomState(0x4D3D3D3)
+            self._noise = 1e-4 * prng.random_sample(2 * size)
+        start = self._noise_offset
+        self._noise_offset = (start + 7919) % size
+        values = np.add(1.0, self._noise[start : start + size])
         if not self.flat:
-            defaultdict.__init__(
-                self,
-                lambda: np.ones((nd, nd, nd), dtype="float64")
-                + 1e-4 * np.random.random((nd, nd, nd)),
-            )
-        else:
-            defaultdict.__init__(
-                self,
-                lambda: np.ones((nd * nd * nd), dtype="float64")
-                + 1e-4 * np.random.random(nd * nd * nd),
-            )
+            values.shape = (self.nd, self.nd, self.nd)
+        return values
 
     def _reshape_vals(self, arr):
         if not self._spatial:
@@ -115,7 +126,7 @@ class FieldDetector(defaultdict):
         # Note that the *only* way this works is if we also fix our field
         # dependencies during checking.  Bug #627 talks about this.
         item = self.ds._last_freq
-        if finfo is not None and finfo._function.__name__ != "NullFunc":
+        if finfo is not None and finfo._function is not NullFunc:
             try:
                 for param, param_v in permute_params.items():
                     for v in param_v:
@@ -134,12 +145,8 @@ class FieldDetector(defaultdict):
                 vv = finfo(nfd)
                 if ngz > 0:
                     vv = vv[ngz:-ngz, ngz:-ngz, ngz:-ngz]
-                for i in nfd.requested:
-                    if i not in self.requested:
-                        self.requested.append(i)
-                for i in nfd.requested_parameters:
-                    if i not in self.requested_parameters:
-                        self.requested_parameters.append(i)
+                self.requested.update(nfd.requested)
+                self.requested_parameters.update(nfd.requested_parameters)
             if vv is not None:
                 if not self.flat:
                     self[item] = vv
@@ -173,9 +180,9 @@ class FieldDetector(defaultdict):
                 # the artio functions for calculating physical times
                 # from internal times
                 self[item] *= -0.1
-            self.requested.append(item)
+            self.requested.setdefault(item)
             return self[item]
-        self.requested.append(item)
+        self.requested.setdefault(item)
         if item not in self:
             self[item] = self._read_data(item)
         return self[item]
@@ -191,7 +198,7 @@ class FieldDetector(defaultdict):
         if kwargs["method"] == "mesh_id":
             if isinstance(self.ds, (StreamParticlesDataset, ParticleDataset)):
                 raise ValueError
-        return np.random.random((self.nd, self.nd, self.nd))
+        return self._default_values().reshape(self.shape)
 
     def mesh_sampling_particle_field(self, *args, **kwargs):
         pos = args[0]
@@ -199,7 +206,7 @@ class FieldDetector(defaultdict):
         return np.random.rand(npart)
 
     def smooth(self, *args, **kwargs):
-        tr = np.random.random((self.nd, self.nd, self.nd))
+        tr = self._default_values().reshape(self.shape)
         if kwargs["method"] == "volume_weighted":
             return [tr]
 
@@ -209,10 +216,9 @@ class FieldDetector(defaultdict):
         return None
 
     def _read_data(self, field_name):
-        self.requested.append(field_name)
+        self.requested.setdefault(field_name)
         finfo = self.ds._get_field_info(*field_name)
         if finfo.sampling_type == "particle":
-            self.requested.append(field_name)
             return np.ones(self.NumberOfParticles)
         return YTArray(
             defaultdict.__missing__(self, field_name),
@@ -223,7 +229,7 @@ class FieldDetector(defaultdict):
     def get_field_parameter(self, param, default=0.0):
         if self.field_parameters and param in self.field_parameters:
             return self.field_parameters[param]
-        self.requested_parameters.append(param)
+        self.requested_parameters.setdefault(param)
         if param in ["center", "normal"] or param.startswith("bulk"):
             if param == "bulk_magnetic_field":
                 if self.ds.unit_system.has_current_mks:
@@ -263,16 +269,39 @@ class FieldDetector(defaultdict):
     def has_field_parameter(self, param):
         return param in self.field_parameters
 
-    @property
-    def fcoords(self):
-        fc = np.array(
-            np.mgrid[0 : 1 : self.nd * 1j, 0 : 1 : self.nd * 1j, 0 : 1 : self.nd * 1j]
-        )
+    def _grid_coords(self, start, stop):
+        # This is equivalent to np.mgrid[start:stop:nd*1j] over all three
+        # axes (transposed for spatial detectors), but broadcasts the 1D
+        # coordinates into the output rather than building and copying the
+        # dense (3, nd, nd, nd) grid.
+        nd = self.nd
+        x = np.linspace(start, stop, nd)
         if self.flat:
-            fc.shape = (self.nd * self.nd * self.nd, 3)
+            coords = np.empty((3, nd, nd, nd), dtype="float64")
+            coords[0] = x[:, None, None]
+            coords[1] = x[None, :, None]
+            coords[2] = x[None, None, :]
+            coords.shape = (nd * nd * nd, 3)
         else:
-            fc = fc.transpose()
-        return self.ds.arr(fc, units="code_length")
+            coords = np.empty((nd, nd, nd, 3), dtype="float64")
+            coords[..., 0] = x[None, None, :]
+            coords[..., 1] = x[None, :, None]
+            coords[..., 2] = x[:, None, None]
+        return coords
+
+    # The coordinate arrays below depend only on nd and flat, which are
+    # fixed for a given detector, so they are only built once.
+    _fcoords = None
+    _icoords = None
+    _ires = None
+    _fwidth = None
+
+    @property
+    def fcoords(self):
+        if self._fcoords is None:
+            fc = self._grid_coords(0, 1)
+            self._fcoords = self.ds.arr(fc, units="code_length")
+        return self._fcoords
 
     @property
     def fcoords_vertex(self):
@@ -283,27 +312,27 @@ class FieldDetector(defaultdict):
 
     @property
     def icoords(self):
-        ic = np.mgrid[
-            0 : self.nd - 1 : self.nd * 1j,
-            0 : self.nd - 1 : self.nd * 1j,
-            0 : self.nd - 1 : self.nd * 1j,
-        ]
-        if self.flat:
-            ic.shape = (self.nd * self.nd * self.nd, 3)
-        else:
-            ic = ic.transpose()
-        return ic
+        if self._icoords is None:
+            self._icoords = self._grid_coords(0, self.nd - 1)
+        return self._icoords
 
     @property
     def ires(self):
-        ir = np.ones(self.nd ** 3, dtype="int64")
-        if not self.flat:
-            ir.shape = (self.nd, self.nd, self.nd)
-        return ir
+        if self._ires is None:
+            if self.flat:
+                shape = (self.nd ** 3,)
+            else:
+                shape = (self.nd, self.nd, self.nd)
+            self._ires = np.ones(shape, dtype="int64")
+        return self._ires
 
     @property
     def fwidth(self):
-        fw = np.ones((self.nd ** 3, 3), dtype="float64") / self.nd
-        if not self.flat:
-            fw.shape = (self.nd, self.nd, self.nd, 3)
-        return self.ds.arr(fw, units="code_length")
+        if self._fwidth is None:
+            if self.flat:
+                shape = (self.nd ** 3, 3)
+            else:
+                shape = (self.nd, self.nd, self.nd, 3)
+            fw = np.full(shape, 1.0 / self.nd, dtype="float64")
+            self._fwidth = self.ds.arr(fw, units="code_length")
+        return self._fwidth
@@ -1,8 +1,13 @@
 import numpy as np
 
+from yt.utilities.exceptions import YTFieldNotFound
 from yt.utilities.lib.misc_utilities import obtain_position_vector
 
 
+def NullFunc(field, data):
+    raise YTFieldNotFound(field.name)
+
+
 def get_radius(data, field_prefix, ftype):
     unit_system = data.ds.unit_system
     center = data.get_field_parameter("center").in_base(unit_system.name)
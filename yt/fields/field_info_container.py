@@ -1,4 +1,5 @@
 from collections import defaultdict
+from itertools import chain
 from numbers import Number as numeric_type
 from typing import Optional, Tuple
 
@@ -536,14 +537,6 @@ class FieldInfoContainer(dict):
             **kwargs,
         )
 
-    def has_key(self, key):
-        # This gets used a lot
-        if key in self:
-            return True
-        if self.fallback is None:
-            return False
-        return key in self.fallback
-
     def __missing__(self, key):
         if self.fallback is None:
             raise KeyError(f"No field named {key}")
@@ -557,22 +550,22 @@ class FieldInfoContainer(dict):
         return obj
 
     def __contains__(self, key):
-        if dict.__contains__(self, key):
-            return True
-        if self.fallback is None:
-            return False
-        return key in self.fallback
+        # This gets used a lot
+        return dict.__contains__(self, key) or (
+            self.fallback is not None and key in self.fallback
+        )
+
+    has_key = __contains__
 
     def __iter__(self):
-        yield from dict.__iter__(self)
-        if self.fallback is not None:
-            yield from self.fallback
+        if self.fallback is None:
+            return dict.__iter__(self)
+        return chain(dict.__iter__(self), self.fallback)
 
     def keys(self):
-        keys = dict.keys(self)
-        if self.fallback:
-            keys += list(self.fallback.keys())
-        return keys
+        if self.fallback is None:
+            return list(dict.keys(self))
+        return list(chain(dict.keys(self), self.fallback.keys()))
 
     def check_derived_fields(self, fields_to_check=None):
 
@@ -2,15 +2,14 @@ import numpy as np
 
 from yt.units.unit_object import Unit
 from yt.utilities.chemical_formulas import compute_mu
-from yt.utilities.lib.misc_utilities import obtain_relative_velocity_vector
+from yt.utilities.lib.misc_utilities import (
+    compute_partial_derivative,
+    obtain_relative_velocity_vector,
+)
 
 from .derived_field import ValidateParameter, ValidateSpatial
 from .field_plugin_registry import register_field_plugin
-from .vector_operations import (
-    create_averaged_field,
-    create_magnitude_field,
-    create_vector_fields,
-)
+from .vector_operations import create_averaged_field, create_vector_fields
 
 
 @register_field_plugin
@@ -262,42 +261,84 @@ def setup_gradient_fields(registry, grad_field, field_units, slice_info=None):
         div_fac = 2.0
     else:
         sl_left, sl_right, div_fac = slice_info
-    slice_3d = (slice(1, -1), slice(1, -1), slice(1, -1))
+    # offsets of the left and right stencil points relative to each cell
+    left_offset = (sl_left.start or 0) - 1
+    right_offset = (sl_right.start or 0) - 1
+    axis_order = registry.ds.coordinates.axis_order
+
+    def _swap_block_order(data, arr):
+        if getattr(data, "_block_order", "C") == "F":
+            # Fortran-ordering: we need to swap axes here and
+            # reswap below
+            return arr.swapaxes(0, 2)
+        return arr
+
+    def _get_spacing(data, ax):
+        # only the first product allocates, the metric factors are applied
+        # in place
+        dx = div_fac * data[ftype, f"d{ax}"]
+        if ax in ("theta", "phi"):
+            dx *= data[ftype, "r"]
+        if ax == "phi":
+            dx *= np.sin(data[ftype, "theta"])
+        return _swap_block_order(data, dx)
+
+    def _partial_derivative(field_data, dx, axi, out, accumulate_square=False):
+        field_data = np.asarray(field_data, dtype=np.float64)
+        dx = np.asarray(dx, dtype=np.float64)
+        out = out.d
+        if field_data.ndim == 3:
+            # the kernel operates on blocks of cells, here there is only one
+            field_data = field_data[..., np.newaxis]
+            dx = dx[..., np.newaxis]
+            out = out[..., np.newaxis]
+        compute_partial_derivative(
+            field_data, dx, out, axi, left_offset, right_offset, accumulate_square
+        )
 
-    def grad_func(axi, ax):
-        slice_3dl = slice_3d[:axi] + (sl_left,) + slice_3d[axi + 1 :]
-        slice_3dr = slice_3d[:axi] + (sl_right,) + slice_3d[axi + 1 :]
+    def _empty_with_zero_boundary(field_data):
+        # The kernel writes every interior cell, so only the boundary cells
+        # need to be zeroed rather than the whole array.
+        new_field = np.empty_like(field_data, dtype=np.float64)
+        for axi in range(3):
+            for edge in (0, -1):
+                new_field[(slice(None),) * axi + (edge,)] = 0.0
+        return new_field
 
+    def grad_func(axi, ax):
         def func(field, data):
-            block_order = getattr(data, "_block_order", "C")
-            if block_order == "F":
-                # Fortran-ordering: we need to swap axes here and
-                # reswap below
-                field_data = data[grad_field].swapaxes(0, 2)
-            else:
-                field_data = data[grad_field]
-            dx = div_fac * data[ftype, f"d{ax}"]
-            if ax == "theta":
-                dx *= data[ftype, "r"]
-            if ax == "phi":
-                dx *= data[ftype, "r"] * np.sin(data[ftype, "theta"])
-            f = field_data[slice_3dr] / dx[slice_3d]
-            f -= field_data[slice_3dl] / dx[slice_3d]
-            new_field = np.zeros_like(data[grad_field], dtype=np.float64)
+            field_data = _swap_block_order(data, data[grad_field])
+            dx = _get_spacing(data, ax)
+            new_field = _empty_with_zero_boundary(field_data)
             new_field = data.ds.arr(new_field, field_data.units / dx.units)
-            new_field[slice_3d] = f
-
-            if block_order == "F":
-                new_field = new_field.swapaxes(0, 2)
-
-            return new_field
+            _partial_derivative(field_data, dx, axi, new_field)
+            return _swap_block_order(data, new_field)
 
         return func
 
+    def _gradient_magnitude(field, data):
+        # All the partial derivatives are computed from a single load of the
+        # field, and their squares are accumulated directly into the output,
+        # rather than evaluating each of the gradient components as a
+        # separate derived field.
+        field_data = _swap_block_order(data, data[grad_field])
+        new_field = None
+        for axi, ax in enumerate(axis_order[: registry.ds.dimensionality]):
+            dx = _get_spacing(data, ax)
+            if new_field is None:
+                new_field = np.zeros_like(field_data, dtype=np.float64)
+                new_field = data.ds.arr(new_field, field_data.units / dx.units)
+                dx_units = dx.units
+            else:
+                dx.convert_to_units(dx_units)
+            _partial_derivative(field_data, dx, axi, new_field, accumulate_square=True)
+        np.sqrt(new_field.d, out=new_field.d)
+        return _swap_block_order(data, new_field)
+
     field_units = Unit(field_units, registry=registry.ds.unit_registry)
     grad_units = field_units / registry.ds.unit_system["length"]
 
-    for axi, ax in enumerate(registry.ds.coordinates.axis_order):
+    for axi, ax in enumerate(axis_order):
         f = grad_func(axi, ax)
         registry.add_field(
             (ftype, f"{fname}_gradient_{ax}"),
@@ -307,10 +348,10 @@ def setup_gradient_fields(registry, grad_field, field_units, slice_info=None):
             units=grad_units,
         )
 
-    create_magnitude_field(
-        registry,
-        f"{fname}_gradient",
-        grad_units,
-        ftype=ftype,
+    registry.add_field(
+        (ftype, f"{fname}_gradient_magnitude"),
+        sampling_type="local",
+        function=_gradient_magnitude,
         validators=[ValidateSpatial(1, [grad_field])],
+        units=grad_units,
     )
@@ -0,0 +1,26 @@
+from yt.fields.field_info_container import FieldInfoContainer
+from yt.testing import assert_equal
+
+
+def test_fallback_lookup():
+    fallback = FieldInfoContainer(None, [])
+    fallback["gas", "density"] = "fallback density"
+    fallback["gas", "temperature"] = "fallback temperature"
+    fi = FieldInfoContainer(None, [])
+    fi.fallback = fallback
+    fi["gas", "velocity_x"] = "velocity_x"
+
+    assert ("gas", "velocity_x") in fi
+    assert ("gas", "density") in fi
+    assert ("gas", "pressure") not in fi
+    assert fi.has_key(("gas", "temperature"))  # noqa: W601
+    assert_equal(fi["gas", "density"], "fallback density")
+
+    expected = [("gas", "velocity_x"), ("gas", "density"), ("gas", "temperature")]
+    assert_equal(list(fi.keys()), expected)
+    assert_equal(list(fi), expected)
+
+    # keys() is a list snapshot whether or not there is a fallback
+    assert isinstance(fi.keys(), list)
+    assert isinstance(fallback.keys(), list)
+    assert_equal(fallback.keys(), expected[1:])
@@ -1,6 +1,7 @@
 import numpy as np
 
 from yt import load
+from yt.fields.derived_field import DerivedField
 from yt.frontends.stream.fields import StreamFieldInfo
 from yt.testing import (
     assert_allclose_units,
@@ -238,6 +239,18 @@ def test_add_gradient_fields():
             assert str(ret.units) == "1/cm"
 
 
+def test_gradient_magnitude():
+    ds = fake_random_ds(16)
+    ds.add_gradient_fields(("gas", "density"))
+    ad = ds.all_data()
+    mag = np.sqrt(
+        ad["gas", "density_gradient_x"] ** 2
+        + ad["gas", "density_gradient_y"] ** 2
+        + ad["gas", "density_gradient_z"] ** 2
+    )
+    assert_allclose_units(ad["gas", "density_gradient_magnitude"], mag)
+
+
 def test_add_gradient_fields_by_fname():
     ds = fake_amr_ds(fields=("density", "temperature"), units=("g/cm**3", "K"))
     actual = ds.add_gradient_fields(("gas", "density"))
@@ -473,6 +486,34 @@ def test_field_inference():
     assert_equal(ds._last_freq, (None, None))
 
 
+def test_field_dependencies_per_dataset():
+    ds = fake_random_ds(16)
+    ds.index
+    # dependencies are memoized per dataset, not on the shared field object
+    deps = ds.field_dependencies["gas", "cell_mass"]
+    assert ("stream", "density") in deps.requested
+    fi = ds._get_field_info("gas", "cell_mass")
+    fd = fi.get_dependencies(ds=ds)
+    assert set(fd.requested) == deps.requested
+    # every call probes with a fresh detector
+    assert fi.get_dependencies(ds=ds) is not fd
+
+
+def test_lambda_field_dependencies():
+    ds = fake_random_ds(16)
+    fi = DerivedField(
+        ("gas", "lambda_density"),
+        "cell",
+        lambda field, data: data["gas", "density"],
+        units="g/cm**3",
+        ds=ds,
+    )
+    assert fi._is_lambda
+    # lambdas are not probed, they only request themselves
+    fd = fi.get_dependencies(ds=ds)
+    assert_equal(list(fd.requested), [("gas", "lambda_density")])
+
+
 @requires_file(ISOGAL)
 def test_deposit_amr():
     ds = load(ISOGAL)
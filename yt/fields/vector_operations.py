@@ -45,12 +45,13 @@ def create_magnitude_field(
         if data.has_field_parameter(f"bulk_{basename}"):
             fn = (fn[0], f"relative_{fn[1]}")
         d = data[fn]
-        mag = (d) ** 2
+        mag = d * d
         for idim in range(1, registry.ds.dimensionality):
             fn = field_components[idim]
             if data.has_field_parameter(f"bulk_{basename}"):
                 fn = (fn[0], f"relative_{fn[1]}")
-            mag += (data[fn]) ** 2
+            d = data[fn]
+            mag += d * d
         return np.sqrt(mag)
 
     registry.add_field(
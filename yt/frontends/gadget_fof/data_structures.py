@@ -1,7 +1,7 @@
 import os
 import weakref
 from collections import defaultdict
-from functools import partial
+from functools import lru_cache, partial
 
 import numpy as np
 
@@ -15,6 +15,7 @@ from yt.frontends.halo_catalog.data_structures import HaloCatalogFile
 from yt.funcs import only_on_root, setdefaultattr
 from yt.geometry.particle_geometry_handler import ParticleIndex
 from yt.utilities.cosmology import Cosmology
+from yt.utilities.file_handler import valid_hdf5_signature
 from yt.utilities.logger import ytLogger as mylog
 from yt.utilities.on_demand_imports import _h5py as h5py
 
@@ -32,55 +33,68 @@ class GadgetFOFParticleIndex(ParticleIndex):
     def _calculate_particle_index_starts(self):
         # Halo indices are not saved in the file, so we must count by hand.
         # File 0 has halos 0 to N_0 - 1, file 1 has halos N_0 to N_0 + N_1 - 1, etc.
-        particle_count = defaultdict(int)
-        offset_count = 0
-        for data_file in self.data_files:
-            data_file.index_start = {
-                ptype: particle_count[ptype] for ptype in data_file.total_particles
-            }
-            data_file.offset_start = offset_count
-            for ptype in data_file.total_particles:
-                particle_count[ptype] += data_file.total_particles[ptype]
-            offset_count += data_file.total_offset
+        ptypes = self.ds.particle_types_raw
+        counts = np.array(
+            [
+                [data_file.total_particles[ptype] for ptype in ptypes]
+                for data_file in self.data_files
+            ],
+            dtype=np.int64,
+        ).reshape(len(self.data_files), len(ptypes))
+        index_starts = counts.cumsum(axis=0) - counts
+        offsets = np.array(
+            [data_file.total_offset for data_file in self.data_files], dtype=np.int64
+        )
+        offset_starts = offsets.cumsum() - offsets
+
+        for data_file, index_start, offset_start in zip(
+            self.data_files, index_starts.tolist(), offset_starts.tolist()
+        ):
+            data_file.index_start = dict(zip(ptypes, index_start))
+            data_file.offset_start = offset_start
 
         self._halo_index_start = {
-            ptype: np.array(
-                [data_file.index_start[ptype] for data_file in self.data_files]
-            )
-            for ptype in self.ds.particle_types_raw
+            ptype: index_starts[:, i] for i, ptype in enumerate(ptypes)
         }
 
     def _calculate_file_offset_map(self):
         # After the FOF is performed, a load-balancing step redistributes halos
         # and then writes more fields.  Here, for each file, we create a list of
         # files which contain the rest of the redistributed particles.
-        ifof = np.array(
-            [data_file.total_particles["Group"] for data_file in self.data_files]
-        )
-        isub = np.array([data_file.total_offset for data_file in self.data_files])
-        subend = isub.cumsum()
-        fofend = ifof.cumsum()
-        istart = np.digitize(fofend - ifof, subend - isub) - 1
-        iend = np.clip(np.digitize(fofend, subend), 0, ifof.size - 2)
+        nfiles = len(self.data_files)
+        counts = np.array(
+            [
+                (data_file.total_particles["Group"], data_file.total_offset)
+                for data_file in self.data_files
+            ],
+            dtype=np.int64,
+        ).reshape(nfiles, 2)
+        fofend, subend = counts.cumsum(axis=0).T
+        fofstart, substart = fofend - counts[:, 0], subend - counts[:, 1]
+        istart = np.searchsorted(substart, fofstart, side="right") - 1
+        iend = np.clip(np.searchsorted(subend, fofend, side="right"), 0, nfiles - 2)
         for i, data_file in enumerate(self.data_files):
             data_file.offset_files = self.data_files[istart[i] : iend[i] + 1]
 
     def _detect_output_fields(self):
-        field_list = []
+        # dicts are used as insertion-ordered sets
+        field_list = {}
         units = {}
         found_fields = {
             ptype: False for ptype, pnum in self.particle_count.items() if pnum > 0
         }
+        identify_fields = self.io._identify_fields
 
         for data_file in self.data_files:
-            fl, _units = self.io._identify_fields(data_file)
+            fl, _units = identify_fields(data_file)
             units.update(_units)
-            field_list.extend([f for f in fl if f not in field_list])
+            field_list.update(dict.fromkeys(fl))
             for ptype in found_fields:
                 found_fields[ptype] |= data_file.total_particles[ptype]
             if all(found_fields.values()):
                 break
 
+        field_list = list(field_list)
         self.field_list = field_list
         ds = self.dataset
         ds.particle_types = tuple({pt for pt, ds in field_list})
@@ -103,16 +117,58 @@ class GadgetFOFParticleIndex(ParticleIndex):
         self._calculate_file_offset_map()
 
 
+def _open_h5(filename):
+    """
+    Open a catalog file for reading with a large, fixed-size metadata cache.
+
+    Catalogs are read mostly through many small attribute and group lookups,
+    so the metadata cache would otherwise be resized constantly.
+    """
+    fapl = h5py.h5p.create(h5py.h5p.FILE_ACCESS)
+    config = fapl.get_mdc_config()
+    config.set_initial_size = True
+    config.initial_size = 128 * 1024 * 1024
+    config.max_size = max(config.max_size, config.initial_size)
+    config.evictions_enabled = True
+    # h5py does not expose the resize mode enums, 0 is H5C_incr__off,
+    # H5C_flash_incr__off and H5C_decr__off respectively
+    config.incr_mode = 0
+    config.flash_incr_mode = 0
+    config.decr_mode = 0
+    fapl.set_mdc_config(config)
+    # raw data chunk cache: nslots, nbytes, w0 (the first argument is unused)
+    fapl.set_cache(0, 521, 16 * 1024 * 1024, 0.75)
+    fid = h5py.h5f.open(os.fsencode(filename), h5py.h5f.ACC_RDONLY, fapl=fapl)
+    return h5py.File(fid)
+
+
+@lru_cache(maxsize=256)
+def _read_header(filename, mtime, size):
+    """
+    Read the header and the summed group lengths and subhalo counts of a
+    catalog file.  The modification time and size of the file are only used
+    as part of the cache key, so that files that change are read again.
+    """
+    with _open_h5(filename) as f:
+        header = {str(field): val for field, val in f["Header"].attrs.items()}
+        group_length_sum = f["Group/GroupLen"][()].sum() if "Group/GroupLen" in f else 0
+        group_subs_sum = (
+            f["Group/GroupNsubs"][()].sum() if "Group/GroupNsubs" in f else 0
+        )
+    return header, group_length_sum, group_subs_sum
+
+
+def _get_header(filename):
+    filename = os.path.abspath(filename)
+    stat = os.stat(filename)
+    return _read_header(filename, stat.st_mtime_ns, stat.st_size)
+
+
 class GadgetFOFHDF5File(HaloCatalogFile):
     def __init__(self, ds, io, filename, file_id, frange):
-        with h5py.File(filename, mode="r") as f:
-            self.header = {str(field): val for field, val in f["Header"].attrs.items()}
-            self.group_length_sum = (
-                f["Group/GroupLen"][()].sum() if "Group/GroupLen" in f else 0
-            )
-            self.group_subs_sum = (
-                f["Group/GroupNsubs"][()].sum() if "Group/GroupNsubs" in f else 0
-            )
+        header, self.group_length_sum, self.group_subs_sum = _get_header(filename)
+        # copy, so that the cached header cannot be modified
+        self.header = header.copy()
         self.total_ids = self.header["Nids_ThisFile"]
         self.total_offset = 0
         super().__init__(ds, io, filename, file_id, frange)
@@ -195,10 +251,8 @@ class GadgetFOFDataset(ParticleDataset):
         self.halo = partial(GadgetFOFHaloContainer, ds=self._halos_ds)
 
     def _parse_parameter_file(self):
-        with h5py.File(self.parameter_filename, mode="r") as f:
-            self.parameters = {
-                str(field): val for field, val in f["Header"].attrs.items()
-            }
+        # This also primes the header cache for the first data file.
+        self.parameters = _get_header(self.parameter_filename)[0].copy()
 
         self.dimensionality = 3
         self.refine_by = 2
@@ -296,11 +350,14 @@ class GadgetFOFDataset(ParticleDataset):
 
     @classmethod
     def _is_valid(cls, filename, *args, **kwargs):
+        # Skip opening anything that is not an HDF5 file.
+        if not valid_hdf5_signature(filename):
+            return False
         need_groups = ["Group", "Header", "Subhalo"]
         veto_groups = ["FOF"]
         valid = True
         try:
-            fh = h5py.File(filename, mode="r")
+            fh = _open_h5(filename)
             valid = all(ng in fh["/"] for ng in need_groups) and not any(
                 vg in fh["/"] for vg in veto_groups
             )
@@ -325,36 +382,64 @@ class GadgetFOFHaloParticleIndex(GadgetFOFParticleIndex):
         itself.
         """
 
-        self._halo_id_number = np.array(
-            [data_file.total_ids for data_file in self.data_files]
-        )
+        # Gather both per-file counts in a single pass.  These are summed
+        # over all files, so use 64 bits rather than the header's 32.
+        counts = np.array(
+            [
+                (data_file.total_ids, data_file.group_length_sum)
+                for data_file in self.data_files
+            ],
+            dtype=np.int64,
+        ).reshape(len(self.data_files), 2)
+        self._halo_id_number = counts[:, 0]
+        self._group_length_sum = counts[:, 1]
         self._halo_id_end = self._halo_id_number.cumsum()
         self._halo_id_start = self._halo_id_end - self._halo_id_number
-
-        self._group_length_sum = np.array(
-            [data_file.group_length_sum for data_file in self.data_files]
+        self._group_length_start = (
+            self._group_length_sum.cumsum() - self._group_length_sum
         )
+        # cumulative group lengths within each file, read as needed
+        self._group_length_offsets = {}
+
+    def _get_group_member_start(self, i_file, group_index):
+        """
+        Get the index of the first member particle of a group, counting over
+        all files.  The group lengths of each file are only read once, since
+        halos tend to be accessed many at a time.
+        """
+        offsets = self._group_length_offsets.get(i_file)
+        if offsets is None:
+            with h5py.File(self.data_files[i_file].filename, mode="r") as f:
+                lengths = f["Group"]["GroupLen"][()]
+            offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            self._group_length_offsets[i_file] = offsets
+        return self._group_length_start[i_file] + offsets[group_index]
 
     def _detect_output_fields(self):
-        field_list = []
-        scalar_field_list = []
+        # dicts are used as insertion-ordered sets
+        field_list = {}
+        scalar_field_list = {}
         units = {}
         found_fields = {
             ptype: False for ptype, pnum in self.particle_count.items() if pnum > 0
         }
         has_ids = False
+        identify_fields = self.io._identify_fields
 
         for data_file in self.data_files:
-            fl, sl, idl, _units = self.io._identify_fields(data_file)
+            fl, sl, idl, _units = identify_fields(data_file)
             units.update(_units)
-            field_list.extend([f for f in fl if f not in field_list])
-            scalar_field_list.extend([f for f in sl if f not in scalar_field_list])
+            field_list.update(dict.fromkeys(fl))
+            scalar_field_list.update(dict.fromkeys(sl))
             for ptype in found_fields:
                 found_fields[ptype] |= data_file.total_particles[ptype]
             has_ids |= len(idl) > 0
             if all(found_fields.values()) and has_ids:
                 break
 
+        field_list = list(field_list)
+        scalar_field_list = list(scalar_field_list)
         self.field_list = field_list
         self.scalar_field_list = scalar_field_list
         ds = self.dataset
@@ -376,7 +461,20 @@ class GadgetFOFHaloParticleIndex(GadgetFOFParticleIndex):
         return fields_to_return, fields_to_generate
 
     def _get_halo_file_indices(self, ptype, identifiers):
-        return np.digitize(identifiers, self._halo_index_start[ptype], right=False) - 1
+        # the starts are sorted, so a binary search finds the containing file
+        return (
+            np.searchsorted(self._halo_index_start[ptype], identifiers, side="right")
+            - 1
+        )
+
+    def _get_member_file_range(self, id_start, id_number):
+        """
+        Get the indices of the first and last files holding the member ids
+        id_start to id_start + id_number.
+        """
+        i_start = np.searchsorted(self._halo_id_start, id_start, side="right") - 1
+        i_end = np.searchsorted(self._halo_id_end, id_start + id_number, side="left")
+        return i_start, i_end
 
     def _get_halo_scalar_index(self, ptype, identifier):
         i_scalar = self._get_halo_file_indices(ptype, [identifier])[0]
@@ -664,24 +762,17 @@ class GadgetFOFHaloContainer(YTSelectionContainer):
             else:
                 id_offset = 0
 
-        # Calculate the starting index for the member particles.
-        # First, add up all the particles in the earlier files.
-        all_id_start = self.index._group_length_sum[:g_scalar].sum(dtype=np.int64)
-
-        # Now add the halos in this file that come before.
-        with h5py.File(self.index.data_files[g_scalar].filename, mode="r") as f:
-            all_id_start += f["Group"]["GroupLen"][:group_index].sum(dtype=np.int64)
+        # Calculate the starting index for the member particles from all the
+        # particles in the earlier files and in the halos before this one.
+        all_id_start = self.index._get_group_member_start(g_scalar, group_index)
 
         # Add the subhalo offset.
         all_id_start += id_offset
 
         # indices of first and last files containing member particles
-        i_start = (
-            np.digitize([all_id_start], self.index._halo_id_start, right=False)[0] - 1
+        i_start, i_end = self.index._get_member_file_range(
+            all_id_start, self.particle_number
         )
-        i_end = np.digitize(
-            [all_id_start + self.particle_number], self.index._halo_id_end, right=True
-        )[0]
         self.field_data_files = self.index.data_files[i_start : i_end + 1]
 
         # starting and ending indices for each file containing particles
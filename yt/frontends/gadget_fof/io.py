@@ -1,4 +1,5 @@
 from collections import defaultdict
+from operator import attrgetter
 
 import numpy as np
 
@@ -24,7 +25,7 @@ class IOHandlerGadgetFOFHDF5(BaseIOHandler):
         for chunk in chunks:
             for obj in chunk.objs:
                 data_files.update(obj.data_files)
-        for data_file in sorted(data_files, key=lambda x: (x.filename, x.start)):
+        for data_file in sorted(data_files, key=attrgetter("filename", "start")):
             with h5py.File(data_file.filename, mode="r") as f:
                 for ptype in sorted(ptf):
                     coords = data_file._get_particle_positions(ptype, f=f)
@@ -74,7 +75,7 @@ class IOHandlerGadgetFOFHDF5(BaseIOHandler):
         for chunk in chunks:
             for obj in chunk.objs:
                 data_files.update(obj.data_files)
-        for data_file in sorted(data_files, key=lambda x: (x.filename, x.start)):
+        for data_file in sorted(data_files, key=attrgetter("filename", "start")):
             si, ei = data_file.start, data_file.end
             with h5py.File(data_file.filename, mode="r") as f:
                 for ptype, field_list in sorted(ptf.items()):
@@ -0,0 +1,132 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from yt.frontends.gadget_fof.data_structures import (
+    GadgetFOFHaloParticleIndex,
+    GadgetFOFParticleIndex,
+)
+from yt.testing import assert_equal, requires_module
+from yt.utilities.on_demand_imports import _h5py as h5py
+
+
+class FakeDataFile:
+    def __init__(self, file_id, ngroups=0, noffset=0, nids=0, group_length_sum=0):
+        self.file_id = file_id
+        self.total_particles = {"Group": ngroups}
+        self.total_offset = noffset
+        self.total_ids = nids
+        self.group_length_sum = group_length_sum
+        self.filename = None
+
+
+def _fake_index(cls, data_files):
+    # skip the dataset machinery, only the per-file bookkeeping is tested
+    index = cls.__new__(cls)
+    index.data_files = data_files
+    return index
+
+
+def _digitize_offset_map(ifof, isub):
+    # the original implementation, kept as a reference
+    subend = isub.cumsum()
+    fofend = ifof.cumsum()
+    istart = np.digitize(fofend - ifof, subend - isub) - 1
+    iend = np.clip(np.digitize(fofend, subend), 0, ifof.size - 2)
+    return istart, iend
+
+
+def test_file_offset_map():
+    prng = np.random.RandomState(0x4D3D3D3)
+    counts = [
+        # files with no groups, and files with no offsets
+        ([3, 0, 5, 0, 2], [0, 4, 0, 6, 0]),
+        ([0, 0, 7, 1], [2, 2, 2, 2]),
+        ([4, 4, 4], [4, 4, 4]),
+        ([1, 2], [0, 3]),
+    ]
+    for _ in range(20):
+        nfiles = prng.randint(2, 12)
+        counts.append(
+            (prng.randint(0, 4, size=nfiles), prng.randint(0, 4, size=nfiles))
+        )
+
+    for ifof, isub in counts:
+        ifof = np.asarray(ifof)
+        isub = np.asarray(isub)
+        data_files = [
+            FakeDataFile(i, ng, no) for i, (ng, no) in enumerate(zip(ifof, isub))
+        ]
+        index = _fake_index(GadgetFOFParticleIndex, data_files)
+        index._calculate_file_offset_map()
+
+        istart, iend = _digitize_offset_map(ifof, isub)
+        for i, data_file in enumerate(data_files):
+            assert_equal(
+                [df.file_id for df in data_file.offset_files],
+                list(range(ifof.size))[istart[i] : iend[i] + 1],
+            )
+
+
+def test_halo_file_lookup():
+    # files 1 and 4 have no halos and no member ids
+    ngroups = np.array([3, 0, 2, 4, 0, 1])
+    nids = np.array([5, 0, 1, 6, 0, 3])
+    data_files = [
+        FakeDataFile(i, ngroups=ng, nids=ni)
+        for i, (ng, ni) in enumerate(zip(ngroups, nids))
+    ]
+    index = _fake_index(GadgetFOFHaloParticleIndex, data_files)
+    index._halo_index_start = {"Group": ngroups.cumsum() - ngroups}
+    index._create_halo_id_table()
+
+    # every halo, so each file boundary is included
+    identifiers = np.arange(ngroups.sum())
+    assert_equal(
+        index._get_halo_file_indices("Group", identifiers),
+        np.digitize(identifiers, index._halo_index_start["Group"], right=False) - 1,
+    )
+
+    for id_start in range(nids.sum()):
+        for id_number in range(1, nids.sum() - id_start + 1):
+            id_end = id_start + id_number
+            i_start = np.digitize([id_start], index._halo_id_start, right=False)[0] - 1
+            i_end = np.digitize([id_end], index._halo_id_end, right=True)[0]
+            assert_equal(
+                index._get_member_file_range(id_start, id_number), (i_start, i_end)
+            )
+
+
+@requires_module("h5py")
+def test_group_member_start():
+    # the second file has no groups
+    group_lengths = [[4, 1, 7], [], [2, 2], [5]]
+    tmpdir = tempfile.mkdtemp()
+    data_files = []
+    for i, lengths in enumerate(group_lengths):
+        data_file = FakeDataFile(i, group_length_sum=sum(lengths))
+        data_file.filename = os.path.join(tmpdir, f"groups.{i}.hdf5")
+        with h5py.File(data_file.filename, mode="w") as f:
+            f.create_dataset("Group/GroupLen", data=np.array(lengths, dtype=np.int32))
+        data_files.append(data_file)
+
+    index = _fake_index(GadgetFOFHaloParticleIndex, data_files)
+    index._create_halo_id_table()
+    for i, lengths in enumerate(group_lengths):
+        # up to one past the last group, so empty files are also covered
+        for group_index in range(len(lengths) + 1):
+            # the original per-halo computation
+            expected = index._group_length_sum[:i].sum(dtype=np.int64)
+            expected += np.array(lengths[:group_index], dtype=np.int32).sum(
+                dtype=np.int64
+            )
+            assert_equal(index._get_group_member_start(i, group_index), expected)
+            assert_equal(
+                index._group_length_start[i]
+                + index._group_length_offsets[i][group_index],
+                expected,
+            )
+
+    shutil.rmtree(tmpdir)
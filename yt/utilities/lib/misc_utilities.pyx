@@ -684,6 +684,90 @@ def obtain_relative_velocity_vector(
     else:
         raise NotImplementedError(f"Unsupported dimensionality `{dim}`.")
 
+DEF GRADIENT_TILE_SIZE = 16
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def compute_partial_derivative(
+        const np.float64_t[:, :, :, :] field,
+        const np.float64_t[:, :, :, :] dx,
+        np.float64_t[:, :, :, :] out,
+        int axis,
+        int left_offset,
+        int right_offset,
+        bint accumulate_square = False):
+    r"""Difference *field* along *axis* over the interior cells.
+
+    For every cell that is not on the outer boundary of the first three
+    dimensions, this computes
+    ``(field[i + right_offset] - field[i + left_offset]) / dx[i]``
+    (with the offsets applied along *axis*) and stores it in the same cell of
+    *out*.  A centered difference uses offsets of -1 and +1.  The fourth
+    dimension indexes independent blocks (e.g., octs) and is not differenced;
+    3D data can be passed with a trailing axis of length one.  The boundary
+    cells of *out* are left untouched.
+
+    Parameters
+    ----------
+    field : array_like
+        The 4D field to be differenced.
+    dx : array_like
+        The 4D cell spacing along *axis*, including any normalization factor.
+    out : array_like
+        The 4D output array, of the same shape as *field*.
+    axis : int
+        The index of the axis along which to difference.
+    left_offset, right_offset : int
+        The offsets of the left and right stencil points along *axis*.
+    accumulate_square : bool
+        If True, the square of the difference is added to *out* instead of
+        overwriting it.  This is used to build up gradient magnitudes.
+    """
+    cdef int i, j, k, l, n0, n1, n2, n3, dim
+    cdef int ii, jj, i_end, j_end
+    cdef int li = 0, lj = 0, lk = 0, ri = 0, rj = 0, rk = 0
+    cdef np.float64_t val
+    if axis == 0:
+        li, ri = left_offset, right_offset
+    elif axis == 1:
+        lj, rj = left_offset, right_offset
+    elif axis == 2:
+        lk, rk = left_offset, right_offset
+    else:
+        raise ValueError(f"Invalid axis {axis}.")
+    for dim in range(4):
+        if dx.shape[dim] != field.shape[dim] or out.shape[dim] != field.shape[dim]:
+            raise ValueError("field, dx and out must have the same shape.")
+    if left_offset < -1 or left_offset > 1 or right_offset < -1 or right_offset > 1:
+        raise ValueError("Stencil offsets must be in the range [-1, 1].")
+    n0 = field.shape[0]
+    n1 = field.shape[1]
+    n2 = field.shape[2]
+    n3 = field.shape[3]
+    # The first two axes are traversed in tiles, so that the planes of the
+    # field used by the stencil along them stay in cache while a tile is
+    # processed; the last axis is left whole since it is contiguous for
+    # C-ordered grids.
+    for ii in prange(1, n0 - 1, GRADIENT_TILE_SIZE, nogil=True, schedule="static"):
+        i_end = i64min(ii + GRADIENT_TILE_SIZE, n0 - 1)
+        for jj in range(1, n1 - 1, GRADIENT_TILE_SIZE):
+            j_end = i64min(jj + GRADIENT_TILE_SIZE, n1 - 1)
+            for i in range(ii, i_end):
+                for j in range(jj, j_end):
+                    for k in range(1, n2 - 1):
+                        for l in range(n3):
+                            # a single division per cell, rather than
+                            # dividing both stencil points by the spacing
+                            val = (
+                                field[i + ri, j + rj, k + rk, l]
+                                - field[i + li, j + lj, k + lk, l]
+                            ) / dx[i, j, k, l]
+                            if accumulate_square:
+                                out[i, j, k, l] += val * val
+                            else:
+                                out[i, j, k, l] = val
+
 def grow_flagging_field(oofield):
     cdef np.ndarray[np.uint8_t, ndim=3] ofield = oofield.astype("uint8")
     cdef np.ndarray[np.uint8_t, ndim=3] nfield
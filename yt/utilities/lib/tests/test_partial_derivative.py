@@ -0,0 +1,59 @@
+import numpy as np
+
+from yt.testing import assert_equal, assert_raises
+from yt.utilities.lib.misc_utilities import compute_partial_derivative
+
+
+def _reference_difference(field, dx, axis, sl_left, sl_right):
+    interior = (slice(1, -1),) * 3
+    left = interior[:axis] + (sl_left,) + interior[axis + 1 :]
+    right = interior[:axis] + (sl_right,) + interior[axis + 1 :]
+    return (field[right] - field[left]) / dx[interior]
+
+
+def test_partial_derivative():
+    prng = np.random.RandomState(0x4D3D3D3)
+    # large enough to span several tiles of the kernel
+    field = prng.random_sample((37, 34, 6, 2))
+    dx = prng.random_sample(field.shape) + 1.0
+    stencils = [
+        (-1, 1, slice(None, -2), slice(2, None)),
+        (-1, 0, slice(None, -2), slice(1, -1)),
+    ]
+    for left_offset, right_offset, sl_left, sl_right in stencils:
+        for axis in range(3):
+            out = np.zeros_like(field)
+            compute_partial_derivative(field, dx, out, axis, left_offset, right_offset)
+            ref = _reference_difference(field, dx, axis, sl_left, sl_right)
+            assert_equal(out[1:-1, 1:-1, 1:-1], ref)
+            # boundary cells are left untouched
+            out[1:-1, 1:-1, 1:-1] = 0.0
+            assert_equal(np.count_nonzero(out), 0)
+
+    # accumulating the squares gives the squared magnitude
+    out = np.zeros_like(field)
+    mag = 0.0
+    for axis in range(3):
+        compute_partial_derivative(field, dx, out, axis, -1, 1, True)
+        ref = _reference_difference(field, dx, axis, slice(None, -2), slice(2, None))
+        mag += ref * ref
+    np.testing.assert_allclose(out[1:-1, 1:-1, 1:-1], mag, rtol=1e-14)
+
+    # strided (e.g., axis-swapped) inputs are supported
+    swapped = field.swapaxes(0, 2)
+    out = np.zeros_like(swapped)
+    compute_partial_derivative(swapped, dx.swapaxes(0, 2), out, 1, -1, 1)
+    ref = _reference_difference(
+        swapped, dx.swapaxes(0, 2), 1, slice(None, -2), slice(2, None)
+    )
+    assert_equal(out[1:-1, 1:-1, 1:-1], ref)
+
+
+def test_partial_derivative_errors():
+    field = np.ones((4, 4, 4, 1))
+    out = np.zeros_like(field)
+    assert_raises(
+        ValueError, compute_partial_derivative, field, field[:3], out, 0, -1, 1
+    )
+    assert_raises(ValueError, compute_partial_derivative, field, field, out, 3, -1, 1)
+    assert_raises(ValueError, compute_partial_derivative, field, field, out, 0, -2, 1)